@@ -6,15 +6,21 @@ Handles authentication, rate limiting, and response logging.
 import json
 import time
 import base64
-import uuid
+import codecs
+import gzip
 import os
+import random
 import sys
-from typing import List, Dict, Any, Tuple
+import threading
+from typing import List, Dict, Any, Tuple, Iterator
 from datetime import datetime
-from multiprocessing import Pool, Manager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("❌ Error: 'requests' library not found.")
     print("Please install it: pip install requests")
@@ -27,6 +33,44 @@ except ImportError:
     print("Please install it: pip install python-dotenv")
     sys.exit(1)
 
+try:
+    import ijson  # Optional: streams records instead of loading the whole file
+except ImportError:
+    ijson = None
+
+try:
+    import httpx  # Optional: HTTP/2 support (pip install 'httpx[http2]')
+    import h2  # noqa: F401  (required by httpx for HTTP/2)
+except ImportError:
+    httpx = None
+
+from cpu_utils import available_cpus
+from json_utils import dumps_json, write_json
+
+# Request exceptions from either HTTP client, grouped the way they are reported
+if httpx is not None:
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException)
+    _CONNECTION_ERRORS = (requests.exceptions.ConnectionError, httpx.NetworkError)
+    _REQUEST_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+else:
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+    _CONNECTION_ERRORS = (requests.exceptions.ConnectionError,)
+    _REQUEST_ERRORS = (requests.exceptions.RequestException,)
+
+
+# Upper bound on worker processes regardless of NUM_PROCESSES or CPU count
+MAX_PROCESSES = 32
+
+# Requests are I/O-bound, so each process slot runs several request threads
+# (default worker thread count when NUM_WORKERS is not set)
+THREADS_PER_PROCESS = 4
+
+# Upper bound on request threads regardless of NUM_WORKERS
+MAX_WORKERS = 128
+
+# Request bodies smaller than this are sent uncompressed even with GZIP_REQUESTS on
+GZIP_MIN_SIZE = 1024
+
 
 class APIConfig:
     """API configuration loaded from environment variables."""
@@ -47,7 +91,23 @@ class APIConfig:
         self.client_secret = os.getenv('SARDINE_CLIENT_SECRET')
         self.api_url = os.getenv('SARDINE_API_URL', 'https://api.sandbox.sardine.ai/v1/businesses')
         self.rate_limit_delay = float(os.getenv('RATE_LIMIT_DELAY', '0.5'))
-        self.num_processes = int(os.getenv('NUM_PROCESSES', '4'))
+        self.gzip_requests = os.getenv('GZIP_REQUESTS', 'false').strip().lower() in ['true', '1', 'yes']
+        self.http2 = os.getenv('HTTP2', 'false').strip().lower() in ['true', '1', 'yes']
+
+        if self.http2 and httpx is None:
+            print("⚠️  Warning: HTTP2=true requires httpx with HTTP/2 support (pip install 'httpx[http2]')")
+            print("   Falling back to HTTP/1.1")
+            self.http2 = False
+
+        # Never run more workers than usable CPUs (or MAX_PROCESSES)
+        cpu_count = available_cpus()
+        requested_processes = int(os.getenv('NUM_PROCESSES', str(cpu_count)))
+        self.num_processes = max(1, min(requested_processes, cpu_count, MAX_PROCESSES))
+
+        # Request threads wait on the network, not the CPU, so only MAX_WORKERS caps them
+        default_workers = self.num_processes * THREADS_PER_PROCESS
+        requested_workers = int(os.getenv('NUM_WORKERS', str(default_workers)))
+        self.num_workers = max(1, min(requested_workers, MAX_WORKERS))
 
         # Validate required variables
         if not self.client_id or not self.client_secret:
@@ -56,56 +116,296 @@ class APIConfig:
                 "Please set SARDINE_CLIENT_ID and SARDINE_CLIENT_SECRET in .env file."
             )
 
+        # Credentials don't change after loading, so encode them once
+        credentials = f"{self.client_id}:{self.client_secret}"
+        encoded = base64.b64encode(credentials.encode()).decode()
+        self._basic_auth_header = f"Basic {encoded}"
+
     def get_basic_auth_header(self) -> str:
         """
-        Generate Basic Auth header value.
+        Get Basic Auth header value (encoded once when the config is loaded).
 
         Returns:
             Base64 encoded 'clientID:clientSecret'
         """
-        credentials = f"{self.client_id}:{self.client_secret}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        return f"Basic {encoded}"
+        return self._basic_auth_header
+
+
+# Sender state shared by all worker threads, set once by _init_sender
+_API_URL = None
+_AUTH_HEADER = None
+_DELAY = 0.0
+_GZIP = False
+_HTTP2 = False
+
+# Rate limiter state: earliest time.monotonic() at which the next request may start
+_RATE_LIMIT_LOCK = threading.Lock()
+_NEXT_REQUEST_TIME = 0.0
+
+# Set when the batch is interrupted: workers stop waiting and send nothing more
+_STOP_EVENT = threading.Event()
+
+# HTTP session (requests.Session, or httpx.Client for HTTP/2) shared by all
+# worker threads, reused for connection keep-alive
+_SESSION = None
+_SESSION_KEY = None
+
+# Per-process generator for request IDs, reseeded after fork (see _new_request_id)
+_REQUEST_ID_RNG = None
+_REQUEST_ID_RNG_PID = None
+
+# Bit masks that stamp the UUID version (4) and RFC 4122 variant onto 128 random bits
+_UUID4_CLEAR_MASK = ~((0xf000 << 64) | (0xc000 << 48))
+_UUID4_SET_MASK = (0x4000 << 64) | (0x8000 << 48)
+
+
+def _create_session(auth_header: str, pool_size: int = 1) -> requests.Session:
+    """
+    Create an HTTP session with connection pooling and automatic retries.
+
+    Args:
+        auth_header: Basic Auth header value sent with every request
+        pool_size: Number of connections to keep open per host
+
+    Returns:
+        Configured requests.Session
+    """
+    # Retry connection failures and throttling/unavailable responses with backoff.
+    # Read errors and 502/504 gateway errors are not retried: the API may already
+    # have received and stored the record, and POSTs are not idempotent.
+    retry = Retry(
+        total=3,
+        read=False,
+        backoff_factor=0.3,
+        status_forcelist=[429, 503],
+        allowed_methods=frozenset(['POST']),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'Authorization': auth_header,
+        'Content-Type': 'application/json'
+    })
+    return session
+
+
+def _create_http2_client(auth_header: str, pool_size: int = 1) -> 'httpx.Client':
+    """
+    Create an HTTP/2 client that multiplexes concurrent requests over few connections.
+
+    Only connection failures are retried; httpx has no status-based retries.
+
+    Args:
+        auth_header: Basic Auth header value sent with every request
+        pool_size: Maximum number of connections to keep open
+
+    Returns:
+        Configured httpx.Client
+    """
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+    transport = httpx.HTTPTransport(http2=True, retries=3, limits=limits)
+
+    return httpx.Client(
+        transport=transport,
+        headers={
+            'Authorization': auth_header,
+            'Content-Type': 'application/json'
+        },
+        timeout=30.0
+    )
+
+
+def _get_session(auth_header: str, pool_size: int = 1, http2: bool = False):
+    """
+    Get the session for the current process, creating it on first use.
+
+    The session is recreated if the credentials, pool size or protocol change. A
+    session inherited from a parent process (e.g. after fork) is never reused, since
+    its open connections would be shared between processes.
+
+    Args:
+        auth_header: Basic Auth header value sent with every request
+        pool_size: Number of connections to keep open (one per worker thread)
+        http2: Use an HTTP/2 httpx.Client instead of a requests.Session
+
+    Returns:
+        requests.Session (or httpx.Client if http2) for this process
+    """
+    global _SESSION, _SESSION_KEY
+
+    session_key = (os.getpid(), auth_header, pool_size, http2)
+    if _SESSION is None or _SESSION_KEY != session_key:
+        if _SESSION is not None:
+            _SESSION.close()
+        if http2:
+            _SESSION = _create_http2_client(auth_header, pool_size)
+        else:
+            _SESSION = _create_session(auth_header, pool_size)
+        _SESSION_KEY = session_key
+
+    return _SESSION
+
+
+def _new_request_id() -> str:
+    """
+    Generate a random version 4 UUID string for the X-Request-Id header.
+
+    Request IDs only need to be unique, not unpredictable, so they are drawn from
+    a per-process PRNG seeded from os.urandom and formatted directly. This
+    is about 4x faster than str(uuid.uuid4()). The generator is reseeded in each
+    new process so forked workers never repeat their parent's sequence.
+
+    Returns:
+        UUID string (e.g. '49cafd88-8fb7-4963-bf2e-915887fdfde2')
+    """
+    global _REQUEST_ID_RNG, _REQUEST_ID_RNG_PID
+
+    pid = os.getpid()
+    if _REQUEST_ID_RNG is None or _REQUEST_ID_RNG_PID != pid:
+        _REQUEST_ID_RNG = random.Random(os.urandom(32))
+        _REQUEST_ID_RNG_PID = pid
+
+    value = (_REQUEST_ID_RNG.getrandbits(128) & _UUID4_CLEAR_MASK) | _UUID4_SET_MASK
+    hex_value = '%032x' % value
+    return f"{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-{hex_value[16:20]}-{hex_value[20:]}"
+
+
+def _init_sender(
+        api_url: str,
+        auth_header: str,
+        rate_limit_delay: float,
+        num_workers: int = 1,
+        gzip_requests: bool = False,
+        http2: bool = False
+) -> None:
+    """
+    Initialize sender state shared by every request, before any worker starts.
+
+    Args:
+        api_url: API endpoint URL
+        auth_header: Basic Auth header value
+        rate_limit_delay: Minimum delay in seconds between requests across all workers
+        num_workers: Number of worker threads that will send requests
+        gzip_requests: Gzip-compress request bodies of at least GZIP_MIN_SIZE bytes
+        http2: Send requests over HTTP/2 with httpx (must be installed)
+    """
+    global _API_URL, _AUTH_HEADER, _DELAY, _GZIP, _HTTP2, _NEXT_REQUEST_TIME
+
+    _API_URL = api_url
+    _AUTH_HEADER = auth_header
+    _DELAY = rate_limit_delay
+    _GZIP = gzip_requests
+    _HTTP2 = http2
+    _NEXT_REQUEST_TIME = 0.0
+    _STOP_EVENT.clear()
+
+    # Open the session up front, with one pooled connection per worker thread
+    _get_session(auth_header, num_workers, http2)
+
+
+def _wait_for_rate_limit() -> None:
+    """
+    Wait for this worker's turn under the shared rate limit.
+
+    Each call reserves the next request slot and then sleeps outside the lock until
+    that slot starts. The gap between slots is _DELAY, whatever the worker count.
+    The sleep ends early if the batch is interrupted (_STOP_EVENT).
+    """
+    global _NEXT_REQUEST_TIME
+
+    if _DELAY <= 0:
+        return
+
+    with _RATE_LIMIT_LOCK:
+        now = time.monotonic()
+        wait = _NEXT_REQUEST_TIME - now
+        _NEXT_REQUEST_TIME = max(now, _NEXT_REQUEST_TIME) + _DELAY
+
+    if wait > 0:
+        _STOP_EVENT.wait(wait)
+
+
+def _encode_body(record: Dict[str, Any]) -> Tuple[Any, Dict[str, str]]:
+    """
+    Encode a record as a gzip-compressed JSON body when worthwhile.
+
+    Args:
+        record: Record to send
+
+    Returns:
+        Tuple of (compressed body bytes or None, extra headers). None means the
+        record should be sent as regular uncompressed JSON.
+    """
+    if not _GZIP:
+        return None, {}
+
+    body = dumps_json(record, indent=None)
+
+    # Small bodies don't compress enough to be worth it
+    if len(body) < GZIP_MIN_SIZE:
+        return None, {}
+
+    return gzip.compress(body, compresslevel=6), {'Content-Encoding': 'gzip'}
 
 
 def _send_single_request(args: Tuple) -> Dict[str, Any]:
     """
-    Worker function to send a single request (used by multiprocessing).
-    Must be a module-level function for pickle serialization.
+    Worker function to send a single request (run on the sender thread pool).
+    Requires _init_sender to have been called first.
 
     Args:
-        args: Tuple of (record, record_index, api_url, auth_header, rate_limit_delay)
+        args: Tuple of (record, record_index)
 
     Returns:
         Response data dictionary
     """
-    record, record_index, api_url, auth_header, rate_limit_delay = args
+    record, record_index = args
+    api_url = _API_URL
+    auth_header = _AUTH_HEADER
 
     # Generate request ID
-    request_id = str(uuid.uuid4())
+    request_id = _new_request_id()
 
-    # Prepare headers
-    headers = {
-        'Authorization': auth_header,
-        'Content-Type': 'application/json',
-        'X-Request-Id': request_id
-    }
+    # Auth and content type are set once on the shared session
+    session = _SESSION
+    headers = {'X-Request-Id': request_id}
 
     result = {
         'record_index': record_index,
         'request_id': request_id,
-        'timestamp': datetime.now().isoformat(),
-        'request_body': record,
+        'timestamp': None,  # Set when the request is sent, formatted when responses are saved
         'success': False
     }
 
+    # Rate limiting - wait for a free slot before each request
+    _wait_for_rate_limit()
+    result['timestamp'] = time.time()
+
+    # Batch interrupted while waiting - don't start a new request
+    if _STOP_EVENT.is_set():
+        result['status_code'] = None
+        result['error'] = "Cancelled - upload interrupted"
+        result['request_body'] = record
+        return result
+
     try:
-        # Send POST request
-        response = requests.post(
+        # Send POST request (compressed if enabled and worthwhile)
+        body, encoding_headers = _encode_body(record)
+        if body is not None:
+            headers.update(encoding_headers)
+            body_args = {'content': body} if _HTTP2 else {'data': body}
+        else:
+            body_args = {'json': record}
+
+        response = session.post(
             api_url,
             headers=headers,
-            json=record,
-            timeout=30
+            timeout=30,
+            **body_args
         )
 
         # Parse response
@@ -116,15 +416,15 @@ def _send_single_request(args: Tuple) -> Dict[str, Any]:
         if not result['success']:
             result['error'] = f"HTTP {response.status_code}: {response.text[:500]}"
 
-    except requests.exceptions.Timeout:
+    except _TIMEOUT_ERRORS:
         result['status_code'] = None
         result['error'] = "Request timeout (30s)"
 
-    except requests.exceptions.ConnectionError:
+    except _CONNECTION_ERRORS:
         result['status_code'] = None
         result['error'] = "Connection error - unable to reach API"
 
-    except requests.exceptions.RequestException as e:
+    except _REQUEST_ERRORS as e:
         result['status_code'] = None
         result['error'] = f"Request error: {str(e)}"
 
@@ -132,9 +432,10 @@ def _send_single_request(args: Tuple) -> Dict[str, Any]:
         result['status_code'] = None
         result['error'] = f"Unexpected error: {str(e)}"
 
-    # Rate limiting - sleep after each request
-    if rate_limit_delay > 0:
-        time.sleep(rate_limit_delay)
+    # Keep the request body only for failures, to help diagnose them; successful
+    # records can be found in the source JSON by record_index
+    if not result['success']:
+        result['request_body'] = record
 
     return result
 
@@ -147,13 +448,54 @@ def extract_failed_indexes(failed_file_path: str) -> List[int]:
         failed_file_path: Path to failed_*.json file
 
     Returns:
-        List of failed record indexes
+        List of failed record indexes (unordered; send_batch retries in file order)
     """
     with open(failed_file_path, 'r', encoding='utf-8') as f:
         failed_records = json.load(f)
 
-    indexes = [record['record_index'] for record in failed_records]
-    return sorted(indexes)
+    return [record['record_index'] for record in failed_records]
+
+
+def _iter_records(json_file_path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Iterate over the records in a JSON array file.
+
+    Records are streamed with ijson when it is installed, so only the records
+    the caller keeps are held in memory. Without ijson the file is loaded whole.
+
+    Args:
+        json_file_path: Path to JSON file with an array of records
+
+    Yields:
+        Tuples of (record_index, record) with 1-based record indexes
+
+    Raises:
+        ValueError: If the file does not contain a JSON array
+    """
+    # Binary mode: ijson parses bytes without a decoding layer, and json.load
+    # detects the encoding (including a UTF-8 BOM) itself
+    with open(json_file_path, 'rb') as f:
+        if ijson is None:
+            records = json.load(f)
+            if not isinstance(records, list):
+                raise ValueError("JSON file must contain an array of objects")
+            yield from enumerate(records, 1)
+            return
+
+        # Skip a UTF-8 BOM, which ijson doesn't accept
+        start = len(codecs.BOM_UTF8) if f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8 else 0
+        f.seek(start)
+
+        # Check the top-level value is an array before streaming its items
+        first_byte = f.read(1)
+        while first_byte.isspace():
+            first_byte = f.read(1)
+        if first_byte != b'[':
+            raise ValueError("JSON file must contain an array of objects")
+        f.seek(start)
+
+        yield from enumerate(ijson.items(f, 'item', use_float=True), 1)
+
 
 class APISender:
     """Sends business data to Sardine Business API."""
@@ -176,6 +518,9 @@ class APISender:
         self.successful_responses = []
         self.failed_responses = []
 
+        # Session for _send_single_record, kept apart from the shared batch session
+        self._record_session = None
+
     def send_batch(self, json_file_path: str, retry_indexes: List[int] = None) -> Tuple[int, int, float]:
         """
         Send all records from JSON file to API using parallel processing.
@@ -188,37 +533,28 @@ class APISender:
         Returns:
             Tuple of (successful_count, failed_count, duration_seconds)
         """
-        # Load JSON data
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            all_records = json.load(f)
-
-        if not isinstance(all_records, list):
-            raise ValueError("JSON file must contain an array of objects")
-
-        # Filter records if retrying specific indexes
-        if retry_indexes:
-            print(f"\n🔁 RETRY MODE - Processing {len(retry_indexes)} specific records")
-            print(f"   Indexes: {', '.join(map(str, retry_indexes))}\n")
-
-            # Filter records (retry_indexes are 1-based, convert to 0-based)
-            records = []
-            actual_indexes = []
-            for idx in retry_indexes:
-                if 1 <= idx <= len(all_records):
-                    records.append(all_records[idx - 1])
-                    actual_indexes.append(idx)
-                else:
-                    print(f"⚠️  Warning: Index {idx} out of range (max: {len(all_records)}), skipping")
+        # Load JSON data, keeping only the records to send (retry_indexes are 1-based)
+        retry_set = set(retry_indexes) if retry_indexes else None
+        records = []
+        record_index_map = []
+        record_count = 0
+        for idx, record in _iter_records(json_file_path):
+            record_count = idx
+            if retry_set is None or idx in retry_set:
+                records.append(record)
+                record_index_map.append(idx)
+
+        if retry_set:
+            for idx in sorted(retry_set):
+                if not 1 <= idx <= record_count:
+                    print(f"⚠️  Warning: Index {idx} out of range (max: {record_count}), skipping")
 
             if not records:
                 print("❌ No valid indexes to retry")
                 return 0, 0, 0.0
 
-            # Use actual indexes for record numbering
-            record_index_map = actual_indexes
-        else:
-            records = all_records
-            record_index_map = list(range(1, len(records) + 1))
+            print(f"\n🔁 RETRY MODE - Processing {len(records)} specific records")
+            print(f"   Indexes: {', '.join(map(str, record_index_map))}\n")
 
         if len(records) == 0:
             print("❌ No records to process")
@@ -226,13 +562,16 @@ class APISender:
 
         total_records = len(records)
 
+        # No point starting more workers than there are records after the test record
+        num_workers = min(self.config.num_workers, max(1, total_records - 1))
+
         # Test first record (always, unless only 1 record total)
         if total_records > 1:
             # Create test record with correct index
             test_record = records[0]
             test_index = record_index_map[0]
 
-            success, test_result = self._test_single_record(test_record, test_index)
+            success, test_result = self._test_single_record(test_record, test_index, num_workers)
 
             # Store test result
             if success:
@@ -266,46 +605,64 @@ class APISender:
         # Process batch
         print(f"\n📤 Sending {len(records_to_process)} records to Sardine API...")
         print(f"   Endpoint: {self.config.api_url}")
-        print(f"   Parallel workers: {self.config.num_processes}")
-        print(f"   Rate limit: {self.config.rate_limit_delay}s per request\n")
+        print(f"   Parallel workers: {num_workers}")
+        if self.config.http2:
+            print("   Protocol: HTTP/2")
+        print(f"   Rate limit: {self.config.rate_limit_delay}s between requests (all workers)\n")
 
         start_time = datetime.now()
 
-        # Prepare arguments for parallel processing
+        # Prepare shared sender state and arguments for parallel processing (the
+        # session opened for the test record already has num_workers connections)
         auth_header = self.config.get_basic_auth_header()
-        args_list = [
-            (record, idx, self.config.api_url, auth_header, self.config.rate_limit_delay)
-            for record, idx in zip(records_to_process, indexes_to_process)
-        ]
+        _init_sender(
+            self.config.api_url,
+            auth_header,
+            self.config.rate_limit_delay,
+            num_workers,
+            self.config.gzip_requests,
+            self.config.http2
+        )
+        args_list = list(zip(records_to_process, indexes_to_process))
 
         # Execute requests in parallel with progress tracking
         print("   Processing requests...")
-        results = []
+        success_so_far = 0
 
+        executor = ThreadPoolExecutor(max_workers=num_workers)
+        interrupted = False
         try:
-            with Pool(processes=self.config.num_processes) as pool:
-                # Use imap_unordered for progress tracking
-                for i, result in enumerate(pool.imap_unordered(_send_single_request, args_list), 1):
-                    results.append(result)
+            futures = [executor.submit(_send_single_request, args) for args in args_list]
 
-                    # Print progress every 10 records or at the end
-                    if i % 10 == 0 or i == len(records_to_process):
-                        success_so_far = sum(1 for r in results if r['success'])
-                        print(
-                            f"   [{i}/{len(records_to_process)}] Processed - {success_so_far} successful, {i - success_so_far} failed")
+            # Use as_completed for progress tracking
+            for i, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+
+                # Separate successful and failed responses as they arrive
+                if result['success']:
+                    self.successful_responses.append(result)
+                    success_so_far += 1
+                else:
+                    self.failed_responses.append(result)
+
+                # Print progress every 10 records or at the end
+                if i % 10 == 0 or i == len(records_to_process):
+                    print(
+                        f"   [{i}/{len(records_to_process)}] Processed - {success_so_far} successful, {i - success_so_far} failed")
 
         except KeyboardInterrupt:
+            interrupted = True
+            # Wake workers waiting for a rate-limit slot so they send nothing more
+            _STOP_EVENT.set()
             print("\n\n⚠️  Upload interrupted by user")
-            pool.terminate()
-            pool.join()
+            print("   Exiting once requests already sent finish (with connection retries this")
+            print("   can take a few minutes) - press Ctrl-C again to quit immediately")
             raise
 
-        # Separate successful and failed responses
-        for result in results:
-            if result['success']:
-                self.successful_responses.append(result)
-            else:
-                self.failed_responses.append(result)
+        finally:
+            # Drop queued requests if the batch stopped early. After Ctrl-C, don't wait
+            # for requests in flight (they can spend minutes in connection retries).
+            executor.shutdown(wait=not interrupted, cancel_futures=True)
 
         # Calculate duration and rates
         end_time = datetime.now()
@@ -319,8 +676,7 @@ class APISender:
         print(f"\n⏱️  Total time: {duration_seconds:.2f}s")
         if duration_seconds > 0:
             requests_per_min = (len(records_to_process) / duration_seconds) * 60
-            successful_count = sum(1 for r in results if r['success'])
-            successful_per_min = (successful_count / duration_seconds) * 60
+            successful_per_min = (success_so_far / duration_seconds) * 60
             print(f"   Average rate: {requests_per_min:.1f} requests/min")
             print(f"   Successful rate: {successful_per_min:.1f} successful/min")
 
@@ -341,13 +697,20 @@ class APISender:
 
         return self._test_single_record(records[0], 1)
 
-    def _test_single_record(self, record: Dict[str, Any], record_index: int) -> Tuple[bool, Dict[str, Any]]:
+    def _test_single_record(
+            self,
+            record: Dict[str, Any],
+            record_index: int,
+            num_workers: int = 1
+    ) -> Tuple[bool, Dict[str, Any]]:
         """
         Test a single record.
 
         Args:
             record: Business record
             record_index: Index of the record
+            num_workers: Worker threads the batch will use after the test, so the
+                session is opened once with its final pool size
 
         Returns:
             Tuple of (success, result_data)
@@ -357,12 +720,19 @@ class APISender:
         print("=" * 80)
         print(f"Testing record {record_index}...\n")
 
-        # Prepare arguments
+        # Prepare sender state
         auth_header = self.config.get_basic_auth_header()
-        args = (record, record_index, self.config.api_url, auth_header, 0)  # No delay for test
+        _init_sender(
+            self.config.api_url,
+            auth_header,
+            0,  # No delay for test
+            num_workers,
+            gzip_requests=self.config.gzip_requests,
+            http2=self.config.http2
+        )
 
         # Send test request
-        result = _send_single_request(args)
+        result = _send_single_request((record, record_index))
 
         # Display result
         if result['success']:
@@ -403,26 +773,36 @@ class APISender:
             Exception: If request fails
         """
         # Generate request ID
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
 
-        # Prepare headers
-        headers = {
-            'Authorization': self.config.get_basic_auth_header(),
-            'Content-Type': 'application/json',
-            'X-Request-Id': request_id
-        }
+        # Auth and content type are set once on the session. It is separate from
+        # the batch session so sending one record never replaces that pool.
+        if self._record_session is None:
+            if self.config.http2:
+                self._record_session = _create_http2_client(self.config.get_basic_auth_header())
+            else:
+                self._record_session = _create_session(self.config.get_basic_auth_header())
+        session = self._record_session
+        headers = {'X-Request-Id': request_id}
 
         # Send POST request
         try:
-            response = requests.post(
+            response = session.post(
                 self.config.api_url,
                 headers=headers,
                 json=record,
                 timeout=30
             )
 
-            # Check for HTTP errors
-            response.raise_for_status()
+            # Check for HTTP errors (4xx, 5xx)
+            if not 200 <= response.status_code < 300:
+                error_msg = f"HTTP {response.status_code}"
+                try:
+                    error_body = response.json()
+                    error_msg += f": {json.dumps(error_body)}"
+                except:
+                    error_msg += f": {response.text}"
+                raise Exception(error_msg)
 
             # Parse response
             response_body = response.json() if response.text else {}
@@ -432,48 +812,40 @@ class APISender:
                 'record_index': record_index,
                 'request_id': request_id,
                 'status_code': response.status_code,
-                'request_body': record,
                 'response_body': response_body,
                 'timestamp': datetime.now().isoformat()
             }
 
             return response_data
 
-        except requests.exceptions.HTTPError as e:
-            # HTTP error (4xx, 5xx)
-            error_msg = f"HTTP {response.status_code}"
-            try:
-                error_body = response.json()
-                error_msg += f": {json.dumps(error_body)}"
-            except:
-                error_msg += f": {response.text}"
-            raise Exception(error_msg)
-
-        except requests.exceptions.Timeout:
+        except _TIMEOUT_ERRORS:
             raise Exception("Request timeout (30s)")
 
-        except requests.exceptions.ConnectionError:
+        except _CONNECTION_ERRORS:
             raise Exception("Connection error - unable to reach API")
 
-        except requests.exceptions.RequestException as e:
+        except _REQUEST_ERRORS as e:
             raise Exception(f"Request error: {str(e)}")
 
     def _save_responses(self) -> None:
         """Save response data to files."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+        # Workers record raw epoch timestamps; format them once here, off the hot path
+        for result in chain(self.successful_responses, self.failed_responses):
+            if isinstance(result.get('timestamp'), float):
+                result['timestamp'] = datetime.fromtimestamp(result['timestamp']).isoformat()
+
         # Save successful responses
         if self.successful_responses:
             success_file = os.path.join(self.output_dir, f"success_{timestamp}.json")
-            with open(success_file, 'w', encoding='utf-8') as f:
-                json.dump(self.successful_responses, f, indent=2, ensure_ascii=False)
+            write_json(success_file, self.successful_responses)
             print(f"\n✓ Successful responses saved to: {success_file}")
 
         # Save failed responses
         if self.failed_responses:
             failed_file = os.path.join(self.output_dir, f"failed_{timestamp}.json")
-            with open(failed_file, 'w', encoding='utf-8') as f:
-                json.dump(self.failed_responses, f, indent=2, ensure_ascii=False)
+            write_json(failed_file, self.failed_responses)
             print(f"✓ Failed responses saved to: {failed_file}")
 
     def print_summary(self, success_count: int, failed_count: int, total_count: int) -> None:
@@ -3,9 +3,16 @@ Converter module for transforming CSV data to JSON format.
 Handles flat-to-nested conversion, type conversion, and array parsing.
 """
 
-import json
+import os
 import re
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Union, Callable, Tuple, Iterable, Iterator
+
+from json_utils import dumps_json, write_json
+from rules import load_rules
+
+
+# Array fields are separated by pipes and/or commas
+_ARRAY_SEPARATOR = re.compile(r'[|,]')
 
 
 class Converter:
@@ -18,8 +25,13 @@ class Converter:
         Args:
             rules_path: Path to validation_rules_business.json file
         """
-        with open(rules_path, 'r') as f:
-            self.rules = json.load(f)
+        self.rules = load_rules(rules_path)
+
+        # Dot-notation paths split once up front instead of once per row
+        self._field_paths = {field_name: field_name.split('.') for field_name in self.rules}
+
+        # Per-column (path keys, converter) plans for business rows, built on first use
+        self._column_plans = {}
 
     def csv_to_json(self, rows: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """
@@ -39,6 +51,19 @@ class Converter:
 
         return json_objects
 
+    def iter_json(self, rows: Iterable[Dict[str, str]]) -> Iterator[Dict[str, Any]]:
+        """
+        Convert CSV rows to JSON objects lazily, one row at a time.
+
+        Args:
+            rows: Row dictionaries (flat structure with dot notation keys)
+
+        Yields:
+            JSON objects (nested structure)
+        """
+        for row in rows:
+            yield self._convert_row(row)
+
     def csv_to_json_grouped(self, rows: List[Dict[str, str]], group_by_field: str) -> List[Dict[str, Any]]:
         """
         Convert CSV rows to JSON, grouping by a specific field.
@@ -82,7 +107,7 @@ class Converter:
                     continue
                 rule = self.rules.get(field_name, {})
                 converted_value = self._convert_value(value, rule)
-                self._set_nested_value(json_obj, field_name, converted_value)
+                self._set_nested_value(json_obj, self._split_path(field_name), converted_value)
 
             # Build child array from all rows in this group
             children = []
@@ -106,6 +131,19 @@ class Converter:
             json_objects.append(json_obj)
         return json_objects
 
+    def iter_json_locations(self, rows: Iterable[Dict[str, str]]) -> Iterator[Dict[str, Any]]:
+        """
+        Convert location CSV rows to JSON objects lazily, one row at a time.
+
+        Args:
+            rows: Row dictionaries (flat structure with dot notation keys)
+
+        Yields:
+            JSON objects (nested structure)
+        """
+        for row in rows:
+            yield self._convert_location_row_flat(row)
+
     def _convert_location_row_flat(self, row: Dict[str, str]) -> Dict[str, Any]:
         result = {}
         location_tags = self._extract_location_tags_flat(row)
@@ -118,7 +156,7 @@ class Converter:
                 continue
             rule = self.rules.get(field_name, {})
             converted_value = self._convert_value(value, rule)
-            self._set_nested_value(result, field_name, converted_value)
+            self._set_nested_value(result, self._split_path(field_name), converted_value)
 
         if location_tags:
             result['locationTags'] = location_tags
@@ -216,7 +254,7 @@ class Converter:
                 rule = self.rules.get(rule_pattern, {})
 
             converted_value = self._convert_value(value, rule)
-            self._set_nested_value(entity, entity_field, converted_value)
+            self._set_nested_value(entity, self._split_path(entity_field), converted_value)
 
         return entity
 
@@ -236,7 +274,7 @@ class Converter:
             location_field = field_name.replace('location.', '', 1)
             rule = self.rules.get(field_name, {})
             converted_value = self._convert_value(value, rule)
-            self._set_nested_value(location, location_field, converted_value)
+            self._set_nested_value(location, self._split_path(location_field), converted_value)
 
         if location_tags:
             location['locationTags'] = location_tags
@@ -295,6 +333,27 @@ class Converter:
 
         return result
     
+    def _get_column_plan(self, field_name: str) -> Tuple[List[str] | None, Callable[[str], Any] | None]:
+        """
+        Get how a business row column is converted, resolving it once per column.
+
+        Args:
+            field_name: CSV column name
+
+        Returns:
+            Tuple of (path keys, converter). Path keys are None for columns handled
+            separately (businessTags); converter is None for string/enum values.
+        """
+        plan = self._column_plans.get(field_name)
+        if plan is None:
+            if field_name.startswith('business.businessTags.'):
+                plan = (None, None)
+            else:
+                rule = self.rules.get(field_name, {})
+                plan = (self._split_path(field_name), self._get_converter(rule))
+            self._column_plans[field_name] = plan
+        return plan
+
     def _convert_row(self, row: Dict[str, str]) -> Dict[str, Any]:
         """
         Convert a single CSV row to nested JSON object.
@@ -313,24 +372,25 @@ class Converter:
 
         # Process each field in the row
         for field_name, value in row.items():
+            # Type and path for this column are resolved once, not per row
+            keys, converter = self._get_column_plan(field_name)
+
+            # Skip businessTags columns (already processed above)
+            if keys is None:
+                continue
+
             value = value.strip()
 
             # Skip empty values (omit from JSON)
             if not value:
                 continue
 
-            # Skip businessTags columns (already processed above)
-            if field_name.startswith('business.businessTags.'):
-                continue
-
-            # Get the rule for this field to determine type
-            rule = self.rules.get(field_name, {})
-
             # Convert value based on type
-            converted_value = self._convert_value(value, rule)
+            if converter is not None:
+                value = converter(value)
 
             # Build nested structure
-            self._set_nested_value(result, field_name, converted_value)
+            self._set_nested_value(result, keys, value)
 
         # Add business tags if any exist
         if business_tags:
@@ -351,20 +411,37 @@ class Converter:
         Returns:
             Converted value (string, int, bool, or list)
         """
+        converter = self._get_converter(rule)
+        return converter(value) if converter is not None else value
+
+    def _get_converter(self, rule: Dict[str, Any]) -> Callable[[str], Any] | None:
+        """
+        Get the function converting a string value to the rule's type.
+
+        Args:
+            rule: Validation rule containing type information
+
+        Returns:
+            Converter function, or None if the value stays a string
+        """
         field_type = rule.get('type', 'string')
 
         if field_type == 'integer':
-            return int(value)
+            return int
 
         elif field_type == 'boolean':
-            return value.lower() == 'true'
+            return self._parse_boolean
 
         elif field_type == 'array':
             # Split by pipe or comma and return list
-            return self._parse_array(value)
+            return self._parse_array
 
         else:  # string or enum
-            return value
+            return None
+
+    def _parse_boolean(self, value: str) -> bool:
+        """Parse boolean field ('true' in any case is True, anything else False)."""
+        return value.lower() == 'true'
 
     def _parse_array(self, value: str) -> List[str]:
         """
@@ -376,15 +453,8 @@ class Converter:
         Returns:
             List of string values
         """
-        # Split by pipe or comma
-        if '|' in value:
-            items = [item.strip() for item in value.split('|') if item.strip()]
-        elif ',' in value:
-            items = [item.strip() for item in value.split(',') if item.strip()]
-        else:
-            items = [value.strip()] if value.strip() else []
-
-        return items
+        # Split by pipe or comma in a single pass, dropping empty items
+        return [item for item in (part.strip() for part in _ARRAY_SEPARATOR.split(value)) if item]
 
     def _extract_business_tags(self, row: Dict[str, str]) -> List[Dict[str, Any]]:
         """
@@ -459,27 +529,40 @@ class Converter:
         return result
 
 
-    def _set_nested_value(self, obj: Dict[str, Any], path: str, value: Any) -> None:
+    def _split_path(self, path: str) -> List[str]:
         """
-        Set a value in a nested dictionary using dot notation path.
+        Split a dot-notation path into keys, caching the result.
+
+        Args:
+            path: Dot-notation path (e.g., "business.address.city")
+
+        Returns:
+            List of keys (e.g., ["business", "address", "city"])
+        """
+        keys = self._field_paths.get(path)
+        if keys is None:
+            keys = path.split('.')
+            self._field_paths[path] = keys
+        return keys
+
+    def _set_nested_value(self, obj: Dict[str, Any], keys: List[str], value: Any) -> None:
+        """
+        Set a value in a nested dictionary using a pre-split dot notation path.
 
         Example:
-            path = "business.address.city"
+            keys = ["business", "address", "city"]
             Creates: {"business": {"address": {"city": value}}}
 
         Args:
             obj: Dictionary to modify
-            path: Dot-notation path (e.g., "business.address.city")
+            keys: Path keys from _split_path (e.g., for "business.address.city")
             value: Value to set
         """
-        keys = path.split('.')
         current = obj
 
         # Navigate/create nested structure
-        for i, key in enumerate(keys[:-1]):
-            if key not in current:
-                current[key] = {}
-            current = current[key]
+        for key in keys[:-1]:
+            current = current.setdefault(key, {})
 
         # Set the final value
         final_key = keys[-1]
@@ -493,8 +576,44 @@ class Converter:
             json_data: List of JSON objects
             output_path: Path to output file
         """
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+        write_json(output_path, json_data)
+
+    def save_json_stream(self, json_objects: Iterable[Dict[str, Any]], output_path: str) -> int:
+        """
+        Save JSON objects to file as they are produced, without holding them all in memory.
+
+        The file content is identical to save_json for the same objects. Objects
+        are written to a temporary file in the same directory, which replaces
+        output_path only once every object is written, so a failed conversion
+        never leaves a truncated JSON file behind.
+
+        Args:
+            json_objects: JSON objects, e.g. a generator from iter_json
+            output_path: Path to output file
+
+        Returns:
+            Number of objects written
+        """
+        count = 0
+
+        temp_path = output_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for json_obj in json_objects:
+                    f.write('[\n  ' if count == 0 else ',\n  ')
+                    # Nest each object one level deeper, as inside the array
+                    f.write(self.json_to_string(json_obj, indent=2).replace('\n', '\n  '))
+                    count += 1
+
+                f.write('\n]' if count else '[]')
+
+            os.replace(temp_path, output_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        return count
 
     def json_to_string(self, json_data: List[Dict[str, Any]], indent: int = 2) -> str:
         """
@@ -507,4 +626,4 @@ class Converter:
         Returns:
             Formatted JSON string
         """
-        return json.dumps(json_data, indent=indent, ensure_ascii=False)
\ No newline at end of file
+        return dumps_json(json_data, indent).decode('utf-8')
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+CPU count helper shared by the API sender and the parallel validator.
+"""
+
+import os
+
+
+def available_cpus() -> int:
+    """
+    Get the number of CPUs this process may use.
+
+    Honors SLURM_CPUS_ON_NODE when running under a Slurm allocation, then the
+    process CPU affinity mask, then the machine CPU count.
+
+    Returns:
+        Number of usable CPUs (at least 1)
+    """
+    slurm_cpus = os.getenv('SLURM_CPUS_ON_NODE')
+    if slurm_cpus:
+        try:
+            return max(1, int(slurm_cpus))
+        except ValueError:
+            pass
+
+    if hasattr(os, 'sched_getaffinity'):
+        return max(1, len(os.sched_getaffinity(0)))
+
+    return os.cpu_count() or 1
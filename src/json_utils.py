@@ -0,0 +1,52 @@
+"""
+JSON serialization helpers shared by the converter and API sender.
+Uses orjson when it is installed, with the standard library as fallback.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson  # Optional: faster JSON serialization
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data: Any, indent: int | None = 2) -> bytes:
+    """
+    Serialize data to UTF-8 JSON.
+
+    orjson is used for compact output and 2-space indentation (the only indent it
+    supports). The standard library handles other indents and data orjson cannot
+    serialize (e.g. integers wider than 64 bits).
+
+    Args:
+        data: JSON-serializable data
+        indent: Indentation level, or None for compact output
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass
+
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
+
+
+def write_json(file_path: str, data: Any) -> None:
+    """
+    Write data to a file as indented UTF-8 JSON.
+
+    Args:
+        file_path: Path to output file
+        data: JSON-serializable data
+    """
+    encoded = dumps_json(data)
+    with open(file_path, 'wb') as f:
+        f.write(encoded)
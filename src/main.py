@@ -10,10 +10,86 @@ from pathlib import Path
 from validator import Validator
 import argparse
 from datetime import datetime
+from itertools import chain
+from typing import Dict, Iterator, List
 from converter import Converter
 from api_sender import APIConfig, APISender, extract_failed_indexes
 
 
+# Default error limit for --fail-fast (only the first few errors are printed anyway)
+FAIL_FAST_MAX_ERRORS = 10000
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a command-line integer that must be at least 1.
+
+    Args:
+        value: Argument string
+
+    Returns:
+        Parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer of at least 1
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1 (got {number})")
+    return number
+
+
+def read_headers(file_path: str) -> List[str]:
+    """
+    Read only the header line of a CSV file.
+
+    Args:
+        file_path: Path to CSV file
+
+    Returns:
+        List of column headers
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return next(csv.reader(f), [])
+
+
+def iter_rows(file_path: str) -> Iterator[Dict[str, str]]:
+    """
+    Read CSV rows one at a time.
+
+    Args:
+        file_path: Path to CSV file
+
+    Yields:
+        Row dictionaries (header -> value). Cells missing from a short row are ''
+        and extra values of a long row are collected in a list under the None key.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        # Interned headers match the (interned) rule names by identity in dict lookups
+        headers = [sys.intern(header) for header in next(reader, [])]
+        width = len(headers)
+
+        # Zip rows into dicts directly, csv.DictReader does the same with more per-row overhead
+        for values in reader:
+            if len(values) == width:
+                yield dict(zip(headers, values))
+            elif values:
+                # Ragged row: collect extras the way csv.DictReader does, but fill
+                # missing cells with '' (not None) so the validator and converter
+                # both see them as empty
+                row = dict(zip(headers, values))
+                if len(values) < width:
+                    for key in headers[len(values):]:
+                        row[key] = ''
+                else:
+                    row[None] = values[width:]
+                yield row
+
+
 def load_csv(file_path: str):
     """
     Load CSV file and return headers and rows.
@@ -24,11 +100,7 @@ def load_csv(file_path: str):
     Returns:
         Tuple of (headers list, rows list of dicts)
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        headers = list(reader.fieldnames)
-        rows = list(reader)
-    return headers, rows
+    return read_headers(file_path), list(iter_rows(file_path))
 
 
 def print_validation_results(result, header_errors):
@@ -50,7 +122,7 @@ def print_validation_results(result, header_errors):
         print()
 
     # Print validation results
-    if result.is_valid and not header_errors:
+    if result.is_valid and not header_errors and not result.summary.truncated:
         print("✅ VALIDATION PASSED!")
         print("-" * 80)
         print(f"Total rows: {result.summary.total_rows}")
@@ -69,6 +141,10 @@ def print_validation_results(result, header_errors):
         print(f"Valid rows: {result.summary.valid_rows}")
         print(f"Invalid rows: {result.summary.invalid_rows}")
 
+        if result.summary.truncated:
+            print(f"\n⚠️  Stopped at row {result.summary.total_rows} after {len(result.errors)} errors "
+                  "(--fail-fast); remaining rows were not validated")
+
         if result.summary.error_breakdown:
             print("\nError Summary:")
             for error_msg, count in result.summary.error_breakdown.items():
@@ -128,6 +204,12 @@ Examples:
   # Retry all failed records from a failed response file
   python main.py input.csv --send-api --retry-failed output/responses/failed_20250216.json
 
+  # Validate large files using 4 processes
+  python main.py input.csv --workers 4
+
+  # Stop validating a badly broken file after the first 1000 errors
+  python main.py input.csv --fail-fast 1000
+
   # Use custom paths
   python main.py input.csv --rules config/rules.json --output output/json --send-api
         """
@@ -150,6 +232,11 @@ Examples:
                         choices=['business', 'entities', 'locations'],
                         default='business',
                         help='API endpoint to use (default: business)')
+    parser.add_argument('--workers', type=positive_int, default=1,
+                        help='Number of processes used to validate rows (default: 1)')
+    parser.add_argument('--fail-fast', type=positive_int, nargs='?', const=FAIL_FAST_MAX_ERRORS, default=None,
+                        metavar='MAX_ERRORS',
+                        help=f'Stop validating rows after MAX_ERRORS errors (default: {FAIL_FAST_MAX_ERRORS})')
 
     return parser.parse_args()
 
@@ -205,10 +292,10 @@ def main():
         validator = Validator(rules_file_path)
         print("   ✓ Validation rules loaded\n")
 
-        # Step 2: Load CSV file
-        print(f"📂 Loading CSV file: {csv_file_path}")
-        headers, rows = load_csv(csv_file_path)
-        print(f"   ✓ CSV loaded: {len(rows)} rows, {len(headers)} columns\n")
+        # Step 2: Read CSV headers (rows are streamed from the file when needed)
+        print(f"📂 Reading CSV file: {csv_file_path}")
+        headers = read_headers(csv_file_path)
+        print(f"   ✓ CSV opened: {len(headers)} columns\n")
 
         # Step 3: Validate headers
         print("🔍 Validating CSV headers...")
@@ -222,14 +309,19 @@ def main():
 
         # Step 4: Validate rows
         print("🔍 Validating data rows...")
-        result = validator.validate_rows(rows)
-        print("   ✓ Validation complete\n")
+        if args.workers > 1:
+            result = validator.validate_rows_parallel(
+                iter_rows(csv_file_path), workers=args.workers, max_errors=args.fail_fast
+            )
+        else:
+            result = validator.validate_rows_columnar(iter_rows(csv_file_path), max_errors=args.fail_fast)
+        print(f"   ✓ Validation complete: {result.summary.total_rows} rows\n")
 
         # Step 5: Display validation results
         print_validation_results(result, header_errors)
 
-        # Step 6: If validation failed, stop here
-        if not result.is_valid or header_errors:
+        # Step 6: If validation failed (or stopped before the last row), stop here
+        if not result.is_valid or header_errors or result.summary.truncated:
             sys.exit(1)
 
         # Step 7: Warn user about paid enrichment services
@@ -258,25 +350,36 @@ def main():
         # Initialize converter
         converter = Converter(rules_file_path)
 
+        # Generate output filename
+        output_filename = generate_output_filename(csv_file_path)
+        json_output_path = os.path.join(output_dir, output_filename)
+
         # Convert rows to JSON (different logic based on endpoint)
         if endpoint == 'entities':
-            json_data = converter.csv_to_json_grouped(rows, 'businessId')
-            print(f"   ✓ Converted {len(rows)} entity rows into {len(json_data)} grouped records\n")
+            # Grouping by businessId needs every row at once
+            rows = list(iter_rows(csv_file_path))
+            json_objects = converter.csv_to_json_grouped(rows, 'businessId')
+            print(f"   ✓ Converted {len(rows)} entity rows into {len(json_objects)} grouped records\n")
         elif endpoint == 'locations':
-            json_data = converter.csv_to_json_locations(rows)
-            print(f"   ✓ Converted {len(rows)} location records into JSON\n")
+            # Second pass over the file: rows are converted and written one at a time
+            json_objects = converter.iter_json_locations(iter_rows(csv_file_path))
         else:
             # For business endpoint: one row = one JSON object
-            json_data = converter.csv_to_json(rows)
-            print(f"   ✓ Converted {len(json_data)} records to JSON\n")
+            json_objects = converter.iter_json(iter_rows(csv_file_path))
 
-        # Generate output filename
-        output_filename = generate_output_filename(csv_file_path)
-        json_output_path = os.path.join(output_dir, output_filename)
+        # Keep the first record for the preview
+        json_objects = iter(json_objects)
+        first_record = next(json_objects, None)
+        if first_record is not None:
+            json_objects = chain([first_record], json_objects)
 
         # Save JSON to file
         print(f"💾 Saving JSON to: {json_output_path}")
-        converter.save_json(json_data, json_output_path)
+        record_count = converter.save_json_stream(json_objects, json_output_path)
+        if endpoint == 'locations':
+            print(f"   ✓ Converted {record_count} location records into JSON")
+        elif endpoint != 'entities':
+            print(f"   ✓ Converted {record_count} records to JSON")
         print(f"   ✓ JSON file saved successfully\n")
 
         # Print conversion summary
@@ -285,14 +388,14 @@ def main():
         print("=" * 80)
         print(f"Input:  {csv_file_path}")
         print(f"Output: {json_output_path}")
-        print(f"Records: {len(json_data)}")
+        print(f"Records: {record_count}")
         print("=" * 80 + "\n")
 
         # Preview first record
-        if json_data:
+        if first_record is not None:
             print("Preview of first record:")
             print("-" * 80)
-            print(converter.json_to_string([json_data[0]], indent=2))
+            print(converter.json_to_string([first_record], indent=2))
             print("-" * 80 + "\n")
 
         # Step 9: Send to API if requested
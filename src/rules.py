@@ -0,0 +1,49 @@
+"""
+Rules module for loading validation rule files.
+Parses each rules file once per process and shares it between the validator and converter.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Any
+
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
+
+def load_rules(rules_path: str) -> Dict[str, Any]:
+    """
+    Load a validation rules file.
+
+    The parsed rules are cached, so the validator and converter (and repeated
+    runs in one process) share a single parse. A file that changed on disk is
+    parsed again. The returned dictionary is shared and must not be modified.
+    Validators sent to worker processes don't come through here: they are
+    restored from the rules pickled with them.
+
+    Args:
+        rules_path: Path to validation rules JSON file
+
+    Returns:
+        Dictionary of field name -> rule
+    """
+    return _load_rules_cached(os.path.abspath(rules_path), os.path.getmtime(rules_path))
+
+
+@lru_cache(maxsize=4)
+def _load_rules_cached(rules_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a rules file (cached per path and modification time)."""
+    if orjson is not None:
+        with open(rules_path, 'rb') as f:
+            content = f.read()
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # e.g. NaN or integers wider than 64 bits - let the standard library handle it
+            pass
+
+    with open(rules_path, 'r') as f:
+        return json.load(f)
@@ -4,10 +4,158 @@ Handles field validation, conditional requirements, and error/warning collection
 """
 
 import re
-import json
-from typing import Dict, List, Any, Tuple, Set
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, List, Any, Tuple, NamedTuple, Callable, FrozenSet, Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+
+from cpu_utils import available_cpus
+from rules import load_rules
+
+
+# Array fields are separated by pipes and/or commas (must match the converter)
+_ARRAY_SEPARATOR = re.compile(r'[|,]')
+
+# Accepted (lowercased) boolean values
+_BOOL_SET = frozenset(('true', 'false'))
+
+# Tag names in businessTags/locationTags headers
+_TAG_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]+$')
+
+
+@lru_cache(maxsize=1024)
+def _integer_messages(field_name: str, min_val: int | None, max_val: int | None) -> Tuple[str, str, str]:
+    """Build the (type, minimum, maximum) error messages for an integer field."""
+    return (
+        sys.intern(f"{field_name}: Must be a valid integer"),
+        sys.intern(f"{field_name}: Minimum value is {min_val}"),
+        sys.intern(f"{field_name}: Maximum value is {max_val}")
+    )
+
+
+@lru_cache(maxsize=1024)
+def _boolean_message(field_name: str) -> str:
+    """Build the error message for a boolean field."""
+    return sys.intern(f"{field_name}: Must be 'true' or 'false'")
+
+
+def _compile_wildcard(pattern: str) -> re.Pattern:
+    """Compile a wildcard rule key (e.g. 'business.businessTags.*') into a regex."""
+    # Escape dots, replace * with one or more non-dot characters
+    regex_pattern = pattern.replace('.', '\\.').replace('*', '[^.]+')
+    return re.compile(f'^{regex_pattern}$')
+
+
+def _levenshtein(s1: str, s2: str, max_distance: int | None = None) -> int:
+    """
+    Calculate Levenshtein distance between two strings.
+
+    Common prefixes and suffixes are trimmed first (field names mostly share
+    their dotted prefix), then a single DP row is updated in place.
+
+    Args:
+        s1: First string
+        s2: Second string
+        max_distance: Optional bound; once the distance is known to exceed it,
+            max_distance + 1 is returned without finishing the table
+
+    Returns:
+        Edit distance between the strings
+    """
+    # Trim shared prefix and suffix, they never add to the distance
+    start = 0
+    end1 = len(s1)
+    end2 = len(s2)
+    while start < end1 and start < end2 and s1[start] == s2[start]:
+        start += 1
+    while end1 > start and end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    s1 = s1[start:end1]
+    s2 = s2[start:end2]
+
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+
+    # The length difference alone is a lower bound on the distance
+    if max_distance is not None and len(s1) - len(s2) > max_distance:
+        return max_distance + 1
+
+    if not s2:
+        return len(s1)
+
+    row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, start=1):
+        diagonal = row[0]
+        row[0] = left = i
+        for j, c2 in enumerate(s2, start=1):
+            above = row[j]
+            if c1 == c2:
+                left = diagonal
+            else:
+                left = min(left, above, diagonal) + 1
+            row[j] = left
+            diagonal = above
+
+        # Row minimums never decrease, so stop once every cell is over the bound
+        if max_distance is not None and min(row) > max_distance:
+            return max_distance + 1
+
+    return row[-1]
+
+
+def _strip_row(row: Dict[str, str]) -> Dict[str, str]:
+    """
+    Return a copy of a row with every value stripped (missing values become '').
+
+    Extra values of a row longer than the header (a list under the None key, as
+    csv.DictReader collects them) are kept as they are and reported by the
+    wildcard pass.
+    """
+    return {
+        key: value if key is None else value.strip() if value else ''
+        for key, value in row.items()
+    }
+
+
+def _check_max_errors(max_errors: int | None) -> None:
+    """Reject an error limit that would stop validation before any error is found."""
+    if max_errors is not None and max_errors < 1:
+        raise ValueError(f"max_errors must be at least 1 (got {max_errors})")
+
+
+def _iter_blocks(rows: Iterable[Dict[str, str]], block_size: int) -> Iterator[Tuple[int, List[Dict[str, str]]]]:
+    """Split rows into blocks, yielding (number of rows before the block, block)."""
+    rows = iter(rows)
+    start = 0
+    while True:
+        block = list(islice(rows, block_size))
+        if not block:
+            return
+        yield start, block
+        start += len(block)
+
+
+# Validator used by validate_rows_parallel worker processes (set once per worker)
+_WORKER_VALIDATOR = None
+
+
+def _init_worker(validator: 'Validator') -> None:
+    """Store the validator in a worker process."""
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = validator
+
+
+def _validate_block_in_worker(
+        rows: List[Dict[str, str]],
+        start: int
+) -> Tuple[int, List[List['ValidationError']], List[List['ValidationWarning']]]:
+    """Validate a block of rows in a worker process."""
+    return (start, *_WORKER_VALIDATOR._validate_block(rows, start))
 
 
 class WarningType(Enum):
@@ -26,18 +174,34 @@ class ErrorType(Enum):
     LENGTH_VALIDATION = "length_validation"
     RANGE_VALIDATION = "range_validation"
     CONDITIONAL_REQUIRED = "conditional_required"
+    EXTRA_VALUES = "extra_values"
 
 
-@dataclass
+# Error types bound once at import (enum attribute lookups are slow when creating many errors)
+_REQUIRED_FIELD = ErrorType.REQUIRED_FIELD
+_PATTERN_MISMATCH = ErrorType.PATTERN_MISMATCH
+_ENUM_VALIDATION = ErrorType.ENUM_VALIDATION
+_TYPE_VALIDATION = ErrorType.TYPE_VALIDATION
+_LENGTH_VALIDATION = ErrorType.LENGTH_VALIDATION
+_RANGE_VALIDATION = ErrorType.RANGE_VALIDATION
+_CONDITIONAL_REQUIRED = ErrorType.CONDITIONAL_REQUIRED
+_EXTRA_VALUES = ErrorType.EXTRA_VALUES
+
+# Error for a row with more values than the header has columns
+_EXTRA_VALUES_MESSAGE = "Row has more values than there are columns in the header"
+
+
+@dataclass(slots=True)
 class ValidationError:
     """Represents a validation error."""
     row_number: int
     field: str
     error_type: ErrorType
     message: str
+    breakdown_key: str = ''  # Key the error is counted under in the summary
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationWarning:
     """Represents a validation warning."""
     row_number: int
@@ -55,6 +219,7 @@ class ValidationSummary:
     rows_with_warnings: int
     error_breakdown: Dict[str, int] = field(default_factory=dict)
     warning_breakdown: Dict[str, int] = field(default_factory=dict)
+    truncated: bool = False  # Validation stopped early at max_errors
 
 
 @dataclass
@@ -71,6 +236,30 @@ class ValidationResult:
         return len(self.errors) == 0 and len(self.header_errors) == 0
 
 
+class _CompiledConditional(NamedTuple):
+    """conditionalRequired rule, preprocessed once when rules are loaded."""
+    depends_on: Tuple[str, ...]
+    when_not_in: FrozenSet[str] | None  # Single dependency; None when any of depends_on being set is enough
+    message_parts: List[str]  # Full error message split around '{value}'
+
+
+class _CompiledRule(NamedTuple):
+    """Validation rule for one field, preprocessed once when rules are loaded."""
+    name: str
+    field_type: str
+    required: bool
+    conditional: _CompiledConditional | None
+    check: Callable[..., List[ValidationError]] | None  # Type validator, None if nothing to check
+    pattern: re.Pattern | None  # 'pattern' for strings, 'itemPattern' for arrays
+    min_length: int | None
+    max_length: int | None
+    min_value: int | None
+    max_value: int | None
+    allowed_values: FrozenSet[str]  # 'values' for enums, 'enumValues' for arrays
+    allowed_text: str  # Allowed values joined for error messages
+    description: str
+
+
 class Validator:
     """Validates CSV data against schema rules."""
 
@@ -81,8 +270,133 @@ class Validator:
         Args:
             rules_path: Path to validation_rules_business.json file
         """
-        with open(rules_path, 'r') as f:
-            self.rules = json.load(f)
+        self.rules = load_rules(rules_path)
+
+        self._compile_rules()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only the rules (compiled rules hold bound methods, they are rebuilt on load)."""
+        return {'rules': self.rules}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a pickled validator, e.g. in a worker process.
+
+        The rules come from the pickle, not from load_rules, so a worker validates
+        against exactly the rules the parent loaded even if the file has changed
+        since. They are recompiled here, once per worker.
+        """
+        self.rules = state['rules']
+        self._compile_rules()
+
+    def _compile_rules(self) -> None:
+        """Compile every rule once so row validation does no rule lookups or type dispatch."""
+        self._compiled_by_key = {
+            rule_key: self._compile_rule(rule_key, rule) for rule_key, rule in self.rules.items()
+        }
+        self._compiled = tuple(
+            compiled for rule_key, compiled in self._compiled_by_key.items() if '*' not in rule_key
+        )
+        self._exact_fields = frozenset(compiled.name for compiled in self._compiled)
+
+        # Wildcard rules as compiled regexes (in rules file order), and the rule each field resolved to
+        self._wildcard_patterns = tuple(
+            (_compile_wildcard(rule_key), rule_key) for rule_key in self.rules if '*' in rule_key
+        )
+        self._wildcard_matches = {}
+
+        # Lowercased rule names for typo suggestions, in rules file order
+        self._known_fields_lower = tuple((field_name.lower(), field_name) for field_name in self.rules)
+
+    def _compile_conditional(self, rule_key: str, cond: Dict[str, Any] | None) -> _CompiledConditional | None:
+        """
+        Preprocess a conditionalRequired rule, resolving the kind of dependency once.
+
+        Args:
+            rule_key: Field name the rule applies to
+            cond: conditionalRequired dictionary from the rules file, if any
+
+        Returns:
+            _CompiledConditional, or None if the rule never requires the field
+        """
+        if not cond or 'dependsOn' not in cond:
+            return None
+
+        depends_on = cond['dependsOn']
+
+        # Single field dependency: required unless its value is in whenNotIn
+        if isinstance(depends_on, str):
+            message = f"{rule_key}: {cond.get('message', '')}"
+            return _CompiledConditional(
+                depends_on=(depends_on,),
+                when_not_in=frozenset(cond.get('whenNotIn', [])),
+                message_parts=message.split('{value}')
+            )
+
+        # Multiple field dependencies: required when any of them is present
+        if isinstance(depends_on, list) and cond.get('whenAnyPresent', False):
+            message = sys.intern(f"{rule_key}: {cond.get('message', 'Required based on other fields')}")
+            return _CompiledConditional(
+                depends_on=tuple(depends_on),
+                when_not_in=None,
+                message_parts=[message]
+            )
+
+        return None
+
+    def _compile_rule(self, rule_key: str, rule: Dict[str, Any]) -> _CompiledRule:
+        """
+        Preprocess a rule: compile its regex, convert allowed values to a set and
+        bind the validator for its type.
+
+        Args:
+            rule_key: Field name or wildcard pattern the rule applies to
+            rule: Rule dictionary from the rules file
+
+        Returns:
+            _CompiledRule for the field
+        """
+        field_type = rule.get('type', 'string')
+
+        if field_type == 'array':
+            pattern = rule.get('itemPattern')
+            allowed = rule.get('enumValues') or []
+        else:
+            pattern = rule.get('pattern')
+            allowed = rule.get('values', []) if field_type == 'enum' else []
+
+        if field_type == 'string':
+            # Strings without constraints have nothing to check
+            if rule.get('minLength') or rule.get('maxLength') or pattern:
+                check = self._validate_string
+            else:
+                check = None
+        elif field_type == 'integer':
+            check = self._validate_integer
+        elif field_type == 'boolean':
+            check = self._validate_boolean
+        elif field_type == 'enum':
+            check = self._validate_enum
+        elif field_type == 'array':
+            check = self._validate_array
+        else:
+            check = None
+
+        return _CompiledRule(
+            name=sys.intern(rule_key),
+            field_type=field_type,
+            required=rule.get('required', False),
+            conditional=self._compile_conditional(rule_key, rule.get('conditionalRequired')),
+            check=check,
+            pattern=re.compile(pattern) if pattern else None,
+            min_length=rule.get('minLength'),
+            max_length=rule.get('maxLength'),
+            min_value=rule.get('min'),
+            max_value=rule.get('max'),
+            allowed_values=frozenset(allowed),
+            allowed_text=', '.join(allowed),
+            description=rule.get('description', 'Invalid format')
+        )
 
     def _matches_pattern(self, field_name: str, pattern: str) -> bool:
         """
@@ -98,12 +412,7 @@ class Validator:
         if '*' not in pattern:
             return field_name == pattern
 
-        # Convert pattern to regex
-        # Escape dots, replace * with one or more non-dot characters
-        regex_pattern = pattern.replace('.', '\\.').replace('*', '[^.]+')
-        regex_pattern = f'^{regex_pattern}$'
-
-        return bool(re.match(regex_pattern, field_name))
+        return bool(_compile_wildcard(pattern).match(field_name))
 
     def _get_matching_rule(self, field_name: str) -> tuple:
         """
@@ -119,12 +428,21 @@ class Validator:
         if field_name in self.rules:
             return field_name, self.rules[field_name]
 
-        # Try wildcard patterns
-        for rule_key, rule in self.rules.items():
-            if '*' in rule_key and self._matches_pattern(field_name, rule_key):
-                return rule_key, rule
+        # Wildcard resolution only depends on the field name, so it is done once per column
+        if field_name in self._wildcard_matches:
+            rule_key = self._wildcard_matches[field_name]
+        else:
+            rule_key = None
+            for wildcard_regex, wildcard_key in self._wildcard_patterns:
+                if wildcard_regex.match(field_name):
+                    rule_key = wildcard_key
+                    break
+            self._wildcard_matches[field_name] = rule_key
+
+        if rule_key is None:
+            return None, None
 
-        return None, None
+        return rule_key, self.rules[rule_key]
 
     def _extract_tag_name(self, field_name: str, pattern: str) -> str | None:
         """
@@ -191,7 +509,7 @@ class Validator:
                 if 'business.businessTags.' in header or 'location.locationTags.' in header:
                     tag_name = self._extract_tag_name(header, rule_key)
                     if tag_name:
-                        if not re.match(r'^[a-zA-Z0-9_]+$', tag_name):
+                        if not _TAG_NAME_PATTERN.match(tag_name):
                             header_errors.append(
                                 f"Invalid tag name in '{header}': '{tag_name}' - "
                                 "Tag names may only contain letters, numbers, and underscores"
@@ -199,7 +517,7 @@ class Validator:
                 continue
 
             # Unknown header - try to suggest similar
-            suggestions = self._find_similar_fields(header, set(self.rules.keys()))
+            suggestions = self._find_similar_fields(header.lower())
             if suggestions:
                 header_errors.append(
                     f"Unknown header: '{header}' (did you mean '{suggestions[0]}'?)"
@@ -209,39 +527,200 @@ class Validator:
 
         return header_errors
 
-    def validate_rows(self, rows: List[Dict[str, str]]) -> ValidationResult:
+    def validate_rows(self, rows: Iterable[Dict[str, str]], max_errors: int | None = None) -> ValidationResult:
         """
         Validate all rows of data.
 
         Args:
-            rows: List of row dictionaries (field_name -> value)
+            rows: Row dictionaries (field_name -> value), e.g. a list or a generator
+            max_errors: Stop after the row on which this many errors are reached
+                (summary.truncated is set; later rows are not validated)
 
         Returns:
             ValidationResult containing errors, warnings, and summary
+
+        Raises:
+            ValueError: If max_errors is less than 1
         """
+        _check_max_errors(max_errors)
+
         all_errors = []
         all_warnings = []
-        rows_with_errors = set()
-        rows_with_warnings = set()
+        rows_with_errors = 0
+        rows_with_warnings = 0
+        total_rows = 0
+        truncated = False
 
         for idx, row in enumerate(rows, start=1):
             row_errors, row_warnings = self._validate_row(idx, row)
+            total_rows = idx
 
             if row_errors:
                 all_errors.extend(row_errors)
-                rows_with_errors.add(idx)
+                rows_with_errors += 1
 
             if row_warnings:
                 all_warnings.extend(row_warnings)
-                rows_with_warnings.add(idx)
+                rows_with_warnings += 1
+
+            # Fail fast: enough errors to report, skip the remaining rows
+            if max_errors is not None and len(all_errors) >= max_errors:
+                truncated = True
+                break
+
+        # Build summary
+        summary = self._build_summary(
+            total_rows=total_rows,
+            rows_with_errors=rows_with_errors,
+            rows_with_warnings=rows_with_warnings,
+            errors=all_errors,
+            warnings=all_warnings,
+            truncated=truncated
+        )
+
+        return ValidationResult(
+            errors=all_errors,
+            warnings=all_warnings,
+            summary=summary
+        )
+
+    def validate_rows_columnar(
+            self,
+            rows: Iterable[Dict[str, str]],
+            block_size: int = 10000,
+            max_errors: int | None = None
+    ) -> ValidationResult:
+        """
+        Validate all rows of data one column at a time.
+
+        Gives the same result as validate_rows (including error order), but each
+        exact rule is applied to a whole column of a block of rows in a single loop,
+        which is faster for large files. Rows are consumed one block at a time, so
+        a generator is never fully loaded into memory.
+
+        Args:
+            rows: Row dictionaries (field_name -> value), e.g. a list or a generator
+            block_size: Number of rows validated together
+            max_errors: Stop after the row on which this many errors are reached
+                (summary.truncated is set; later rows are not validated)
+
+        Returns:
+            ValidationResult containing errors, warnings, and summary
+
+        Raises:
+            ValueError: If max_errors is less than 1
+        """
+        _check_max_errors(max_errors)
+
+        return self._build_result(
+            ((start, *self._validate_block(block, start)) for start, block in _iter_blocks(rows, block_size)),
+            max_errors
+        )
+
+    def validate_rows_parallel(
+            self,
+            rows: Iterable[Dict[str, str]],
+            workers: int | None = None,
+            block_size: int = 10000,
+            max_errors: int | None = None
+    ) -> ValidationResult:
+        """
+        Validate all rows of data in blocks spread over worker processes.
+
+        Gives the same result as validate_rows. Each block is validated column by
+        column in a worker; results are merged back in row order.
+
+        Args:
+            rows: Row dictionaries (field_name -> value), e.g. a list or a generator
+            workers: Number of worker processes (default: number of usable CPUs)
+            block_size: Number of rows sent to a worker at a time
+            max_errors: Stop after the row on which this many errors are reached
+                (summary.truncated is set; later rows are not validated)
+
+        Returns:
+            ValidationResult containing errors, warnings, and summary
+
+        Raises:
+            ValueError: If max_errors is less than 1
+        """
+        _check_max_errors(max_errors)
+
+        workers = workers or available_cpus()
+
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self,)
+        ) as executor:
+            # Keep only a few blocks in flight so rows are still read lazily
+            pending = deque()
+
+            def iter_block_results():
+                for start, block in _iter_blocks(rows, block_size):
+                    pending.append(executor.submit(_validate_block_in_worker, block, start))
+                    if len(pending) >= workers * 2:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+
+            result = self._build_result(iter_block_results(), max_errors)
+
+            # Drop blocks still queued if validation stopped early
+            executor.shutdown(cancel_futures=True)
+
+            return result
+
+    def _build_result(
+            self,
+            block_results: Iterable[Tuple[int, List[List[ValidationError]], List[List[ValidationWarning]]]],
+            max_errors: int | None = None
+    ) -> ValidationResult:
+        """
+        Merge per-block validation results, in row order, into a ValidationResult.
+
+        Args:
+            block_results: (start, errors per row, warnings per row) for each block, in order
+            max_errors: Stop after the row on which this many errors are reached
+
+        Returns:
+            ValidationResult containing errors, warnings, and summary
+        """
+        all_errors = []
+        all_warnings = []
+        rows_with_errors = 0
+        rows_with_warnings = 0
+        total_rows = 0
+        truncated = False
+
+        for start, errors_by_row, warnings_by_row in block_results:
+            # Collect in row order so errors are reported as validate_rows would
+            for row_errors, row_warnings in zip(errors_by_row, warnings_by_row):
+                total_rows += 1
+
+                if row_errors:
+                    all_errors.extend(row_errors)
+                    rows_with_errors += 1
+
+                if row_warnings:
+                    all_warnings.extend(row_warnings)
+                    rows_with_warnings += 1
+
+                # Fail fast: stop at the same row validate_rows would
+                if max_errors is not None and len(all_errors) >= max_errors:
+                    truncated = True
+                    break
+
+            if truncated:
+                break
 
         # Build summary
         summary = self._build_summary(
-            total_rows=len(rows),
+            total_rows=total_rows,
             rows_with_errors=rows_with_errors,
             rows_with_warnings=rows_with_warnings,
             errors=all_errors,
-            warnings=all_warnings
+            warnings=all_warnings,
+            truncated=truncated
         )
 
         return ValidationResult(
@@ -250,6 +729,89 @@ class Validator:
             summary=summary
         )
 
+    def _validate_block(
+            self,
+            rows: List[Dict[str, str]],
+            start: int
+    ) -> Tuple[List[List[ValidationError]], List[List[ValidationWarning]]]:
+        """
+        Validate a block of rows column by column.
+
+        Args:
+            rows: Rows in the block
+            start: Number of rows before this block (row numbers continue from it)
+
+        Returns:
+            Tuple of (errors, warnings) lists for each row of the block
+        """
+        errors_by_row = [[] for _ in rows]
+        warnings_by_row = [[] for _ in rows]
+
+        # Strip every cell exactly once for the whole validation
+        rows = [_strip_row(row) for row in rows]
+
+        # First pass: Validate each exact-rule column
+        for rule in self._compiled:
+            field_name = rule.name
+            column = [row.get(field_name, "") for row in rows]
+            conditional = rule.conditional
+            check = rule.check
+
+            if conditional is None and not rule.required:
+                # Optional field: only filled-in cells need checking
+                filled = [idx for idx, value in enumerate(column) if value]
+            else:
+                required_message = sys.intern(f"{field_name}: Field is required")
+                filled = []
+                for idx, value in enumerate(column):
+                    row_num = start + idx + 1
+
+                    # Check conditional requirements first (they only apply to empty values)
+                    if conditional is not None and not value:
+                        cond_errors, cond_warnings = self._check_conditional_required(
+                            row_num, field_name, value, conditional, rows[idx]
+                        )
+                        warnings_by_row[idx].extend(cond_warnings)
+
+                        # If conditionally required and missing, skip other validations
+                        if cond_errors:
+                            errors_by_row[idx].extend(cond_errors)
+                            continue
+
+                    # Empty values only fail when the field is required
+                    if not value:
+                        if rule.required:
+                            errors_by_row[idx].append(ValidationError(
+                                row_number=row_num,
+                                field=field_name,
+                                error_type=_REQUIRED_FIELD,
+                                message=required_message,
+                                breakdown_key=required_message
+                            ))
+                        continue
+
+                    filled.append(idx)
+
+            if check is None or not filled:
+                continue
+
+            # Validate type and format of the filled-in cells
+            if rule.field_type == 'integer':
+                self._validate_integer_column(start, field_name, column, filled, rule, errors_by_row)
+            elif rule.field_type == 'boolean':
+                self._validate_boolean_column(start, field_name, column, filled, errors_by_row)
+            else:
+                for idx in filled:
+                    field_errors = check(start + idx + 1, field_name, column[idx], rule)
+                    if field_errors:
+                        errors_by_row[idx].extend(field_errors)
+
+        # Second pass: Validate fields that match wildcard patterns
+        for idx, row in enumerate(rows):
+            errors_by_row[idx].extend(self._validate_wildcard_fields(start + idx + 1, row))
+
+        return errors_by_row, warnings_by_row
+
     def _validate_row(self, row_num: int, row: Dict[str, str]) -> Tuple[List[ValidationError], List[ValidationWarning]]:
         """
         Validate a single row.
@@ -264,21 +826,18 @@ class Validator:
         errors = []
         warnings = []
 
-        # Track which fields we've already validated
-        validated_fields = set()
+        # Strip each value once, dependency checks and the wildcard pass reuse it
+        row = _strip_row(row)
 
         # First pass: Validate fields with exact rules (non-wildcard)
-        for field_name, rule in self.rules.items():
-            if '*' in field_name:  # Skip wildcard patterns for now
-                continue
-
-            value = row.get(field_name, "").strip()
-            validated_fields.add(field_name)
+        for rule in self._compiled:
+            field_name = rule.name
+            value = row.get(field_name, "")
 
             # Check conditional requirements first
-            if 'conditionalRequired' in rule:
+            if rule.conditional is not None:
                 cond_errors, cond_warnings = self._check_conditional_required(
-                    row_num, field_name, value, rule, row
+                    row_num, field_name, value, rule.conditional, row
                 )
                 errors.extend(cond_errors)
                 warnings.extend(cond_warnings)
@@ -288,13 +847,15 @@ class Validator:
                     continue
 
             # Check basic required fields
-            if rule.get('required', False):
+            if rule.required:
                 if not value:
+                    message = sys.intern(f"{field_name}: Field is required")
                     errors.append(ValidationError(
                         row_number=row_num,
                         field=field_name,
-                        error_type=ErrorType.REQUIRED_FIELD,
-                        message=f"{field_name}: Field is required"
+                        error_type=_REQUIRED_FIELD,
+                        message=message,
+                        breakdown_key=message
                     ))
                     continue
 
@@ -303,12 +864,41 @@ class Validator:
                 continue
 
             # Validate type and format
-            field_errors = self._validate_field(row_num, field_name, value, rule)
-            errors.extend(field_errors)
+            if rule.check is not None:
+                errors.extend(rule.check(row_num, field_name, value, rule))
 
         # Second pass: Validate fields that match wildcard patterns
+        errors.extend(self._validate_wildcard_fields(row_num, row))
+
+        return errors, warnings
+
+    def _validate_wildcard_fields(self, row_num: int, row: Dict[str, str]) -> List[ValidationError]:
+        """
+        Validate the fields of a row that only match wildcard rules.
+
+        Args:
+            row_num: Row number (1-indexed)
+            row: Dictionary of stripped field values
+
+        Returns:
+            List of validation errors
+        """
+        errors = []
+
+        exact_fields = self._exact_fields
         for field_name, value in row.items():
-            if field_name in validated_fields:  # Already validated
+            if field_name in exact_fields:  # Already validated
+                continue
+
+            # Values past the last header column belong to no field
+            if field_name is None:
+                errors.append(ValidationError(
+                    row_number=row_num,
+                    field='',
+                    error_type=_EXTRA_VALUES,
+                    message=_EXTRA_VALUES_MESSAGE,
+                    breakdown_key=_EXTRA_VALUES_MESSAGE
+                ))
                 continue
 
             # Try to find a matching wildcard rule
@@ -316,70 +906,66 @@ class Validator:
             if not rule:
                 continue
 
-            value = value.strip()
-
             # Skip empty values for optional fields
             if not value:
                 continue
 
             # Validate the field
-            field_errors = self._validate_field(row_num, field_name, value, rule)
+            field_errors = self._validate_field(row_num, field_name, value, self._compiled_by_key[rule_key])
             errors.extend(field_errors)
 
-        return errors, warnings
+        return errors
 
     def _check_conditional_required(
             self,
             row_num: int,
             field_name: str,
             value: str,
-            rule: Dict[str, Any],
+            cond: _CompiledConditional,
             row: Dict[str, str]
     ) -> Tuple[List[ValidationError], List[ValidationWarning]]:
         """
         Check conditional requirement rules.
 
+        The row's values are expected to be stripped already.
+
         Returns:
             Tuple of (errors, warnings)
         """
         errors = []
         warnings = []
-        cond = rule['conditionalRequired']
+
+        # A filled-in field always satisfies its condition
+        if value:
+            return errors, warnings
 
         # Handle single field dependency (e.g., business.taxId depends on config.kybLevel)
-        if 'dependsOn' in cond and isinstance(cond['dependsOn'], str):
-            depends_on_field = cond['dependsOn']
-            depends_on_value = row.get(depends_on_field, "").strip()
-            when_not_in = cond.get('whenNotIn', [])
+        if cond.when_not_in is not None:
+            depends_on_value = row.get(cond.depends_on[0], "")
 
             # Check if field is required based on dependency
-            if depends_on_value not in when_not_in:
-                if not value:
-                    message = cond.get('message', '').replace('{value}', depends_on_value)
-                    errors.append(ValidationError(
-                        row_number=row_num,
-                        field=field_name,
-                        error_type=ErrorType.CONDITIONAL_REQUIRED,
-                        message=f"{field_name}: {message}"
-                    ))
+            if depends_on_value not in cond.when_not_in:
+                message = depends_on_value.join(cond.message_parts)
+                errors.append(ValidationError(
+                    row_number=row_num,
+                    field=field_name,
+                    error_type=_CONDITIONAL_REQUIRED,
+                    message=message,
+                    breakdown_key=message
+                ))
 
         # Handle multiple field dependencies (e.g., countryCode depends on any address field)
-        elif 'dependsOn' in cond and isinstance(cond['dependsOn'], list):
-            depends_on_fields = cond['dependsOn']
-            when_any_present = cond.get('whenAnyPresent', False)
-
-            if when_any_present:
-                # Check if any of the dependent fields have values
-                any_present = any(row.get(f, "").strip() for f in depends_on_fields)
-
-                if any_present and not value:
-                    message = cond.get('message', 'Required based on other fields')
-                    errors.append(ValidationError(
-                        row_number=row_num,
-                        field=field_name,
-                        error_type=ErrorType.CONDITIONAL_REQUIRED,
-                        message=f"{field_name}: {message}"
-                    ))
+        else:
+            # Check if any of the dependent fields have values
+            if any(row.get(f, "") for f in cond.depends_on):
+                message = cond.message_parts[0]
+                errors.append(ValidationError(
+                    row_number=row_num,
+                    field=field_name,
+                    error_type=_CONDITIONAL_REQUIRED,
+                    message=message,
+                    breakdown_key=message
+                ))
 
         return errors, warnings
 
@@ -425,142 +1011,181 @@ class Validator:
 
         return warnings
 
-    def _validate_field(self, row_num: int, field_name: str, value: str, rule: Dict[str, Any]) -> List[ValidationError]:
+    def _validate_field(self, row_num: int, field_name: str, value: str, rule: _CompiledRule) -> List[ValidationError]:
         """
-        Validate a single field's value against its rule.
+        Validate a single field's value against its compiled rule.
 
         Returns:
             List of validation errors
         """
-        errors = []
-        field_type = rule.get('type', 'string')
+        # Type dispatch was resolved when the rule was compiled
+        if rule.check is None:
+            return []
 
-        # Validate based on type
-        if field_type == 'string':
-            errors.extend(self._validate_string(row_num, field_name, value, rule))
-
-        elif field_type == 'integer':
-            errors.extend(self._validate_integer(row_num, field_name, value, rule))
-
-        elif field_type == 'boolean':
-            errors.extend(self._validate_boolean(row_num, field_name, value, rule))
-
-        elif field_type == 'enum':
-            errors.extend(self._validate_enum(row_num, field_name, value, rule))
+        return rule.check(row_num, field_name, value, rule)
 
-        elif field_type == 'array':
-            errors.extend(self._validate_array(row_num, field_name, value, rule))
-
-        return errors
-
-    def _validate_string(self, row_num: int, field_name: str, value: str, rule: Dict[str, Any]) -> List[
+    def _validate_string(self, row_num: int, field_name: str, value: str, rule: _CompiledRule) -> List[
         ValidationError]:
         """Validate string field."""
         errors = []
 
         # Check length constraints
-        min_length = rule.get('minLength')
-        max_length = rule.get('maxLength')
+        min_length = rule.min_length
+        max_length = rule.max_length
 
         if min_length and len(value) < min_length:
+            message = sys.intern(f"{field_name}: Minimum length is {min_length} characters")
             errors.append(ValidationError(
                 row_number=row_num,
                 field=field_name,
-                error_type=ErrorType.LENGTH_VALIDATION,
-                message=f"{field_name}: Minimum length is {min_length} characters"
+                error_type=_LENGTH_VALIDATION,
+                message=message,
+                breakdown_key=message
             ))
 
         if max_length and len(value) > max_length:
+            message = sys.intern(f"{field_name}: Maximum length is {max_length} characters")
             errors.append(ValidationError(
                 row_number=row_num,
                 field=field_name,
-                error_type=ErrorType.LENGTH_VALIDATION,
-                message=f"{field_name}: Maximum length is {max_length} characters"
+                error_type=_LENGTH_VALIDATION,
+                message=message,
+                breakdown_key=message
             ))
 
         # Check pattern
-        pattern = rule.get('pattern')
-        if pattern:
-            if not re.match(pattern, value):
+        pattern = rule.pattern
+        if pattern is not None:
+            if not pattern.match(value):
+                message = sys.intern(f"{field_name}: {rule.description}")
                 errors.append(ValidationError(
                     row_number=row_num,
                     field=field_name,
-                    error_type=ErrorType.PATTERN_MISMATCH,
-                    message=f"{field_name}: {rule.get('description', 'Invalid format')}"
+                    error_type=_PATTERN_MISMATCH,
+                    message=message,
+                    breakdown_key=message
                 ))
 
         return errors
 
-    def _validate_integer(self, row_num: int, field_name: str, value: str, rule: Dict[str, Any]) -> List[
+    def _validate_integer(self, row_num: int, field_name: str, value: str, rule: _CompiledRule) -> List[
         ValidationError]:
         """Validate integer field."""
-        errors = []
+        errors_by_row = [[]]
+        self._validate_integer_column(row_num - 1, field_name, [value], [0], rule, errors_by_row)
+        return errors_by_row[0]
 
-        # Check if value is a valid integer
-        try:
-            int_value = int(value)
-        except ValueError:
-            errors.append(ValidationError(
-                row_number=row_num,
-                field=field_name,
-                error_type=ErrorType.TYPE_VALIDATION,
-                message=f"{field_name}: Must be a valid integer"
-            ))
-            return errors
+    def _validate_integer_column(
+            self,
+            start: int,
+            field_name: str,
+            column: List[str],
+            filled: List[int],
+            rule: _CompiledRule,
+            errors_by_row: List[List[ValidationError]]
+    ) -> None:
+        """
+        Validate the filled-in cells of an integer column.
 
-        # Check range
-        min_val = rule.get('min')
-        max_val = rule.get('max')
+        Args:
+            start: Number of rows before this block
+            field_name: Column name
+            column: Stripped values of the column
+            filled: Indexes of non-empty cells
+            rule: Compiled rule for the column
+            errors_by_row: Per-row error lists to append to
+        """
+        min_val = rule.min_value
+        max_val = rule.max_value
+
+        # Messages are the same for every cell of the column
+        type_message, min_message, max_message = _integer_messages(field_name, min_val, max_val)
+
+        for idx in filled:
+            try:
+                int_value = int(column[idx])
+            except ValueError:
+                errors_by_row[idx].append(ValidationError(
+                    row_number=start + idx + 1,
+                    field=field_name,
+                    error_type=_TYPE_VALIDATION,
+                    message=type_message,
+                    breakdown_key=type_message
+                ))
+                continue
 
-        if min_val is not None and int_value < min_val:
-            errors.append(ValidationError(
-                row_number=row_num,
-                field=field_name,
-                error_type=ErrorType.RANGE_VALIDATION,
-                message=f"{field_name}: Minimum value is {min_val}"
-            ))
+            if min_val is not None and int_value < min_val:
+                errors_by_row[idx].append(ValidationError(
+                    row_number=start + idx + 1,
+                    field=field_name,
+                    error_type=_RANGE_VALIDATION,
+                    message=min_message,
+                    breakdown_key=min_message
+                ))
 
-        if max_val is not None and int_value > max_val:
-            errors.append(ValidationError(
-                row_number=row_num,
-                field=field_name,
-                error_type=ErrorType.RANGE_VALIDATION,
-                message=f"{field_name}: Maximum value is {max_val}"
-            ))
+            if max_val is not None and int_value > max_val:
+                errors_by_row[idx].append(ValidationError(
+                    row_number=start + idx + 1,
+                    field=field_name,
+                    error_type=_RANGE_VALIDATION,
+                    message=max_message,
+                    breakdown_key=max_message
+                ))
 
-        return errors
+    def _validate_boolean_column(
+            self,
+            start: int,
+            field_name: str,
+            column: List[str],
+            filled: List[int],
+            errors_by_row: List[List[ValidationError]]
+    ) -> None:
+        """
+        Validate the filled-in cells of a boolean column.
 
-    def _validate_boolean(self, row_num: int, field_name: str, value: str, rule: Dict[str, Any]) -> List[
-        ValidationError]:
-        """Validate boolean field."""
-        errors = []
+        Args:
+            start: Number of rows before this block
+            field_name: Column name
+            column: Stripped values of the column
+            filled: Indexes of non-empty cells
+            errors_by_row: Per-row error lists to append to
+        """
+        message = _boolean_message(field_name)
 
-        if value.lower() not in ['true', 'false']:
-            errors.append(ValidationError(
-                row_number=row_num,
-                field=field_name,
-                error_type=ErrorType.TYPE_VALIDATION,
-                message=f"{field_name}: Must be 'true' or 'false'"
-            ))
+        for idx in filled:
+            if column[idx].lower() not in _BOOL_SET:
+                errors_by_row[idx].append(ValidationError(
+                    row_number=start + idx + 1,
+                    field=field_name,
+                    error_type=_TYPE_VALIDATION,
+                    message=message,
+                    breakdown_key=message
+                ))
 
-        return errors
+    def _validate_boolean(self, row_num: int, field_name: str, value: str, rule: _CompiledRule) -> List[
+        ValidationError]:
+        """Validate boolean field."""
+        errors_by_row = [[]]
+        self._validate_boolean_column(row_num - 1, field_name, [value], [0], errors_by_row)
+        return errors_by_row[0]
 
-    def _validate_enum(self, row_num: int, field_name: str, value: str, rule: Dict[str, Any]) -> List[ValidationError]:
+    def _validate_enum(self, row_num: int, field_name: str, value: str, rule: _CompiledRule) -> List[ValidationError]:
         """Validate enum field."""
         errors = []
 
-        allowed_values = rule.get('values', [])
-        if value not in allowed_values:
+        if value not in rule.allowed_values:
+            message = sys.intern(f"{field_name}: Must be one of: {rule.allowed_text}")
             errors.append(ValidationError(
                 row_number=row_num,
                 field=field_name,
-                error_type=ErrorType.ENUM_VALIDATION,
-                message=f"{field_name}: Must be one of: {', '.join(allowed_values)}"
+                error_type=_ENUM_VALIDATION,
+                message=message,
+                breakdown_key=message
             ))
 
         return errors
 
-    def _validate_array(self, row_num: int, field_name: str, value: str, rule: Dict[str, Any]) -> List[ValidationError]:
+    def _validate_array(self, row_num: int, field_name: str, value: str, rule: _CompiledRule) -> List[ValidationError]:
         """Validate array field (pipe or comma separated)."""
         errors = []
 
@@ -568,91 +1193,80 @@ class Validator:
         items = self._split_array_value(value)
 
         # Validate each item against pattern if specified
-        item_pattern = rule.get('itemPattern')
-        if item_pattern:
+        item_pattern = rule.pattern
+        if item_pattern is not None:
             for item in items:
-                if not re.match(item_pattern, item):
+                if not item_pattern.match(item):
+                    message = f"{field_name}: Item '{item}' - {rule.description}"
                     errors.append(ValidationError(
                         row_number=row_num,
                         field=field_name,
-                        error_type=ErrorType.PATTERN_MISMATCH,
-                        message=f"{field_name}: Item '{item}' - {rule.get('description', 'Invalid format')}"
+                        error_type=_PATTERN_MISMATCH,
+                        message=message,
+                        breakdown_key=message
                     ))
 
         # Validate against enum values if specified
-        enum_values = rule.get('enumValues')
-        if enum_values:
+        allowed_values = rule.allowed_values
+        if allowed_values:
             for item in items:
-                if item not in enum_values:
+                if item not in allowed_values:
+                    message = f"{field_name}: Item '{item}' must be one of: {rule.allowed_text}"
                     errors.append(ValidationError(
                         row_number=row_num,
                         field=field_name,
-                        error_type=ErrorType.ENUM_VALIDATION,
-                        message=f"{field_name}: Item '{item}' must be one of: {', '.join(enum_values)}"
+                        error_type=_ENUM_VALIDATION,
+                        message=message,
+                        breakdown_key=message
                     ))
 
         return errors
 
     def _split_array_value(self, value: str) -> List[str]:
         """Split array value by pipe or comma, trim whitespace."""
-        if '|' in value:
-            return [item.strip() for item in value.split('|') if item.strip()]
-        elif ',' in value:
-            return [item.strip() for item in value.split(',') if item.strip()]
-        else:
-            return [value.strip()] if value.strip() else []
+        return [item for item in (part.strip() for part in _ARRAY_SEPARATOR.split(value)) if item]
 
-    def _find_similar_fields(self, header: str, known_fields: Set[str], max_suggestions: int = 1) -> List[str]:
-        """Find similar field names for typo suggestions (simple string distance)."""
+    def _find_similar_fields(self, header_lower: str, max_suggestions: int = 1) -> List[str]:
+        """Find similar field names for a lowercased header (simple string distance)."""
         suggestions = []
-        header_lower = header.lower()
-
-        for field in known_fields:
-            field_lower = field.lower()
+        header_len = len(header_lower)
+        max_distance = 2
 
+        for field_lower, field in self._known_fields_lower:
             # Simple similarity: check if one contains the other or very close match
             if header_lower in field_lower or field_lower in header_lower:
                 suggestions.append(field)
-            elif self._levenshtein_distance(header_lower, field_lower) <= 2:
+            elif (abs(len(field_lower) - header_len) <= max_distance
+                  and _levenshtein(header_lower, field_lower, max_distance) <= max_distance):
                 suggestions.append(field)
 
+            # Later matches would be discarded anyway
+            if len(suggestions) >= max_suggestions:
+                break
+
         return suggestions[:max_suggestions]
 
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
         """Calculate Levenshtein distance between two strings."""
-        if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
-
-        if len(s2) == 0:
-            return len(s1)
-
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-
-        return previous_row[-1]
+        return _levenshtein(s1, s2)
 
     def _build_summary(
             self,
             total_rows: int,
-            rows_with_errors: Set[int],
-            rows_with_warnings: Set[int],
+            rows_with_errors: int,
+            rows_with_warnings: int,
             errors: List[ValidationError],
-            warnings: List[ValidationWarning]
+            warnings: List[ValidationWarning],
+            truncated: bool = False
     ) -> ValidationSummary:
         """Build validation summary statistics."""
 
-        # Count errors by type
-        error_breakdown = {}
-        for error in errors:
-            key = f"{error.field}: {error.message.split(': ', 1)[1] if ': ' in error.message else error.message}"
-            error_breakdown[key] = error_breakdown.get(key, 0) + 1
+        # Count errors by type, using the key set when each error was created
+        error_breakdown = Counter(
+            error.breakdown_key or
+            f"{error.field}: {error.message.split(': ', 1)[1] if ': ' in error.message else error.message}"
+            for error in errors
+        )
 
         # Count warnings by type
         warning_breakdown = {}
@@ -662,9 +1276,10 @@ class Validator:
 
         return ValidationSummary(
             total_rows=total_rows,
-            valid_rows=total_rows - len(rows_with_errors),
-            invalid_rows=len(rows_with_errors),
-            rows_with_warnings=len(rows_with_warnings),
+            valid_rows=total_rows - rows_with_errors,
+            invalid_rows=rows_with_errors,
+            rows_with_warnings=rows_with_warnings,
             error_breakdown=error_breakdown,
-            warning_breakdown=warning_breakdown
+            warning_breakdown=warning_breakdown,
+            truncated=truncated
         )
\ No newline at end of file